@@ -22,13 +22,22 @@ fruit = interactive_prompt(
 confirmed = YesNoPrompt("Delete all recordings?", default="no").ask()
 ```"""
 
+import re
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Sequence, Union
+from typing import Any, Dict, Final, List, Sequence, Tuple, Union
 
 from catalyst import shared
 
 plim = shared.plim  # colour / prompt helper
 
+# comma‑separated tokens, surrounding whitespace and empty entries dropped
+_TOKEN_RE = re.compile(r"[^,\s](?:[^,]*[^,\s])?")
+
+# reserved words
+_ALL_NONE = frozenset({"all", "none"})    # multi‑select shortcuts
+_NO_WORDS = frozenset({"n", "no"})        # confirmation rejections
+_DONE_WORDS = frozenset({"done", ""})     # end of multi free‑form entry
+
 __all__ = [
     "PromptBase",
     "OptionPrompt",
@@ -57,7 +66,7 @@ class PromptBase:
         """Interactively asks until valid or retries exhausted."""
         while self._attempts < self.retries:
             value = self._do_ask()
-            if value is _Retry:
+            if value is _RETRY:
                 self._attempts += 1
                 continue
             if self.confirm and not self._confirm(value):
@@ -74,13 +83,12 @@ class PromptBase:
 
     # helper -----------------------------------------------------------------
     def _confirm(self, value):
-        display = ", ".join(value) if isinstance(value, Sequence) and not isinstance(value, str) else value
+        display = ", ".join(map(str, value)) if isinstance(value, (list, tuple)) else value
         resp = plim.ask(f"⚠️ Confirm selection:\n{display}\nConfirm? [Y/n]")
-        return (resp or "").strip().lower() not in {"n", "no"}
+        return (resp or "").strip().lower() not in _NO_WORDS
 
 
-class _Retry:  # sentinel used to restart the prompt loop
-    pass
+_RETRY: Final = object()  # sentinel used to restart the prompt loop
 
 # ──────────────────────────────────────────────────────────────────────────────
 # Option selection prompt
@@ -100,8 +108,10 @@ class OptionPrompt(PromptBase):
     # computed ---------------------------------------------------------------
     _option_dict: Dict[str, Any] = field(init=False)
     _display_keys: List[str] = field(init=False)
+    _norm_items: List[Tuple[str, Any, Any, Any]] = field(init=False)
     _value_map: Dict[str, Any] = field(init=False)
     _index_map: Dict[str, Any] = field(init=False)
+    _norm_to_display: Dict[Any, str] = field(init=False)
 
     # life‑cycle -------------------------------------------------------------
     def __post_init__(self):
@@ -112,6 +122,11 @@ class OptionPrompt(PromptBase):
             self._option_dict = {opt: opt for opt in self.options}
 
         self._display_keys = list(self._option_dict.keys())
+        cs = self.case_sensitive
+        self._norm_items = [
+            (k, k if cs else k.lower(), v, v if cs else str(v).lower())
+            for k, v in self._option_dict.items()
+        ]
         self._build_maps()
         self._default_keys = self._resolve_default_keys(self.default)
 
@@ -126,10 +141,19 @@ class OptionPrompt(PromptBase):
     # rendering --------------------------------------------------------------
     def _render_prompt(self):
         if self.display == "menu":
+            # batch consecutive plain lines into one call; defaults stay per line
+            defaults = set(self._default_keys)
+            pending: List[str] = []
             for idx, key in enumerate(self._display_keys, 1):
-                tag = " [default]" if key in self._default_keys else ""
-                text = f" [{idx}] {key}{tag}"
-                (plim.bold if key in self._default_keys else plim.plain)(text)
+                if key in defaults:
+                    if pending:
+                        plim.plain("\n".join(pending))
+                        pending = []
+                    plim.bold(f" [{idx}] {key} [default]")
+                else:
+                    pending.append(f" [{idx}] {key}")
+            if pending:
+                plim.plain("\n".join(pending))
             rng = f"1-{len(self._display_keys)}"
             if self.multi:
                 suffix = f" [{rng} / all / none{' / custom' if self.allow_custom else ''}]"
@@ -156,12 +180,12 @@ class OptionPrompt(PromptBase):
         norm = raw if self.case_sensitive else raw.lower()
         if self.multi:
             selected, unknown = [], []
-            for token in [t.strip() for t in norm.split(",") if t.strip()]:
+            for token in _TOKEN_RE.findall(norm):
                 if token in self._index_map:                    # menu index
                     selected.append(self._index_map[token])
                 elif token in self._value_map:                  # key / alias
                     selected.append(self._value_map[token])
-                elif token in {"all", "none"}:               # shortcuts
+                elif token in _ALL_NONE:                      # shortcuts
                     selected = list(self._option_dict.values()) if token == "all" else []
                     break
                 elif self.allow_custom:
@@ -170,7 +194,7 @@ class OptionPrompt(PromptBase):
                     unknown.append(token)
             if unknown:
                 plim.warn(f"⚠️ Invalid input: {', '.join(unknown)}")
-                return _Retry
+                return _RETRY
             return selected
         # single‑select
         if norm in self._index_map:
@@ -180,17 +204,19 @@ class OptionPrompt(PromptBase):
         if self.allow_custom:
             return raw
         plim.warn(f"⚠️ Invalid input. Expected one of: {', '.join(self._display_keys)}")
-        return _Retry
+        return _RETRY
 
     # map builders -----------------------------------------------------------
     def _build_maps(self):
         self._value_map = {}
-        for k, v in self._option_dict.items():
-            k_norm = k if self.case_sensitive else k.lower()
-            v_norm = v if self.case_sensitive else str(v).lower()
+        self._norm_to_display = {}
+        for k, k_norm, v, v_norm in self._norm_items:
             self._value_map[k_norm] = v
             if v_norm != k_norm:
                 self._value_map[v_norm] = v  # alias via value
+            # first match wins, mirroring option order
+            self._norm_to_display.setdefault(k_norm, k)
+            self._norm_to_display.setdefault(v_norm, k)
         self._index_map = {str(i + 1): self._option_dict[k] for i, k in enumerate(self._display_keys)}
 
     def _resolve_default_keys(self, default):
@@ -198,12 +224,7 @@ class OptionPrompt(PromptBase):
             if isinstance(val, int) and 0 <= val < len(self._display_keys):
                 return self._display_keys[val]
             if isinstance(val, str):
-                cmp = val if self.case_sensitive else val.lower()
-                for k, v in self._option_dict.items():
-                    k_cmp = k if self.case_sensitive else k.lower()
-                    v_cmp = v if self.case_sensitive else str(v).lower()
-                    if cmp in {k_cmp, v_cmp}:
-                        return k
+                return self._norm_to_display.get(val if self.case_sensitive else val.lower())
             return None
         if isinstance(default, list):
             return [m for d in default if (m := match(d))]
@@ -226,7 +247,7 @@ class FreeformPrompt(PromptBase):
             values: List[str] = []
             while True:
                 raw = plim.ask(f"{self.prompt} (or type 'done' to finish): ")
-                if raw.lower() in {"done", ""}:
+                if raw.lower() in _DONE_WORDS:
                     break
                 values.append(raw)
                 plim.plain("Current entries:")
@@ -235,11 +256,11 @@ class FreeformPrompt(PromptBase):
                 plim.plain()
             if not values:
                 plim.plain("No entries provided.")
-                return _Retry
+                return _RETRY
             return values
         # single free‑form
         raw = plim.ask(f"{self.prompt}: ")
-        return raw or _Retry
+        return raw or _RETRY
 
 
 # ──────────────────────────────────────────────────────────────────────────────